@@ -8,7 +8,10 @@ A small, inclusive, interactive sci-fi terminal game designed to demo:
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Container, Optional, Tuple
+import functools
+import re
+import sys
 import time
 
 
@@ -16,7 +19,7 @@ import time
 # Data Models
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PlayerPrefs:
     """
     Player accessibility / preference settings.
@@ -26,9 +29,10 @@ class PlayerPrefs:
     reduced_motion: bool = False       # True disables delays/typing effects
     confirm_actions: bool = True       # True asks confirmation on risky actions
     show_tooltips: bool = True         # True shows extra help text
+    cinematic_delays: bool = False     # True enables optional pacing pauses
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """
     Tracks current game progress and meaningful choices.
@@ -45,6 +49,17 @@ class GameState:
 # Inclusivity & UI Helpers
 # -----------------------------
 
+@functools.lru_cache(maxsize=128)
+def _style_cached(text: str, high_contrast: bool) -> str:
+    """
+    Memoized styling. Prompts and titles repeat every redraw, so the
+    upper-cased high-contrast form is built once per unique string.
+    """
+    if high_contrast:
+        return f"=== {text.upper()} ==="
+    return text
+
+
 class UI:
     """
     UI helper that implements multiple inclusivity heuristics via:
@@ -55,53 +70,92 @@ class UI:
     """
     def __init__(self, prefs: PlayerPrefs):
         self.prefs = prefs
+        self._buf: Optional[list] = None
+        self.refresh_prefs()
+
+    def refresh_prefs(self) -> None:
+        """
+        Rebinds pref-dependent behavior; call after prefs change.
+        With tooltips off, hint() is a no-op binding rather than a
+        per-call branch.
+        """
+        self.hint = self._hint_on if self.prefs.show_tooltips else (lambda _: None)
 
     def _style(self, text: str) -> str:
         """
         Applies simple high-contrast styling without relying on color alone.
         (We avoid fancy ASCII art that could reduce readability.)
         """
-        if self.prefs.high_contrast:
-            return f"=== {text.upper()} ==="
-        return text
+        return _style_cached(text, self.prefs.high_contrast)
+
+    def begin_frame(self) -> None:
+        """
+        Starts buffering output. Everything emitted until end_frame()
+        is collected and written to stdout in a single call, instead of
+        one write per header/body/hint.
+        """
+        self._buf = []
+
+    def end_frame(self) -> None:
+        buf, self._buf = self._buf, None
+        if buf:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+
+    def _emit(self, text: str) -> None:
+        if self._buf is not None:
+            self._buf.append(text)
+        else:
+            sys.stdout.write(text)
 
     def header(self, title: str) -> None:
-        print()
-        print(self._style(title))
-        print("-" * max(10, min(70, len(title) + 6)))
+        self._emit(_header_block(title, self.prefs.high_contrast))
+
+    def menu(self, title: str, lines: Tuple[str, ...]) -> None:
+        """
+        Emits a full menu block (header + option lines) through the
+        memoized renderer, honoring the current display prefs.
+        """
+        self._emit(_render_menu(title, lines,
+                                self.prefs.text_size, self.prefs.high_contrast))
 
     def body(self, text: str) -> None:
         """
         Supports 'large text' mode by adding line spacing.
+        Output is assembled into one string and written in a single call,
+        instead of one write (and flush) per line.
         """
         if self.prefs.text_size == "large":
-            for line in text.splitlines():
-                print(line)
-                print()
+            self._emit("\n\n".join(_split(text)) + "\n\n")
         else:
-            print(text)
+            self._emit(text + "\n")
 
-    def hint(self, text: str) -> None:
+    def _hint_on(self, text: str) -> None:
         """
-        Optional tooltips.
+        Optional tooltips (bound to hint() when enabled).
         """
-        if self.prefs.show_tooltips:
-            prefix = "[Hint] "
-            self.body(prefix + text)
+        self.body("[Hint] " + text)
 
     def wait(self, seconds: float) -> None:
         """
-        Reduced-motion support (no artificial delays).
+        Optional pacing pause. Off by default (cinematic_delays) and
+        always skipped under reduced motion, so menus respond instantly.
         """
-        if self.prefs.reduced_motion:
-            return
-        time.sleep(seconds)
+        if self.prefs.cinematic_delays and not self.prefs.reduced_motion:
+            time.sleep(seconds)
 
     def ask(self, prompt: str) -> str:
         """
-        Input prompt with consistent pattern.
+        Input prompt with consistent pattern. The prompt is flushed
+        explicitly before blocking on stdin. True EOF raises EOFError
+        (handled as a graceful exit in main); a blank line returns "".
         """
-        return input(self._style(prompt) + " ").strip()
+        sys.stdout.write(self._style(prompt) + " ")
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:  # readline() returns "" only at EOF; a blank line is "\n"
+            raise EOFError
+        return line.rstrip("\r\n \t")
 
     def confirm(self, prompt: str) -> bool:
         """
@@ -109,8 +163,8 @@ class UI:
         """
         if not self.prefs.confirm_actions:
             return True
-        ans = self.ask(f"{prompt} (y/n):").lower()
-        return ans in ("y", "yes")
+        ans = self.ask(f"{prompt} (y/n):")
+        return bool(ans) and ans[0] in ("y", "Y")
 
     def error(self, text: str) -> None:
         """
@@ -122,10 +176,54 @@ class UI:
         self.body(f"[OK] {text}")
 
 
+@functools.lru_cache(maxsize=64)
+def _header_block(title: str, high_contrast: bool) -> str:
+    """
+    Memoized header (styled title + dash underline). Titles are fixed
+    literals, so each one is formatted once per contrast setting.
+    """
+    styled = _style_cached(title, high_contrast)
+    return "\n" + styled + "\n" + "-" * max(10, min(70, len(title) + 6)) + "\n"
+
+
+@functools.lru_cache(maxsize=128)
+def _split(text: str) -> Tuple[str, ...]:
+    """
+    Memoized splitlines() with blank lines dropped: large-text mode adds
+    its own paragraph spacing, so embedded blanks would stack into extra
+    gaps. Bounded because formatted text (status, mission brief) also
+    passes through, not just static literals.
+    """
+    return tuple(line for line in text.splitlines() if line)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_menu(title: str, lines: Tuple[str, ...],
+                 text_size: str, high_contrast: bool) -> str:
+    """
+    Renders a full menu block (header + option lines) as one string.
+    Menus redraw the same content on every loop iteration, so the result
+    is memoized per (content, display prefs) and written in a single call
+    instead of one UI call per line.
+    """
+    parts = [_header_block(title, high_contrast)]
+    if text_size == "large":
+        # Large mode supplies its own spacing; skip blank separator lines
+        # so gaps stay one blank line wide, matching UI.body.
+        parts.extend(line + "\n\n" for line in lines if line)
+    else:
+        parts.extend(line + "\n" for line in lines)
+    return "".join(parts)
+
+
 # -----------------------------
 # Quality Attribute Checks
 # -----------------------------
 
+# Compiled once; re's C engine finds any ASCII control char in one scan.
+_NAME_RE = re.compile(r"[\x00-\x1f]")
+
+
 def validate_ship_name(name: str) -> Tuple[bool, str]:
     """
     Reliability: input validation for ship name.
@@ -136,12 +234,12 @@ def validate_ship_name(name: str) -> Tuple[bool, str]:
         return False, "Ship name can't be empty."
     if len(name) > 24:
         return False, "Ship name must be 24 characters or fewer."
-    if any(ord(c) < 32 for c in name):
+    if _NAME_RE.search(name):
         return False, "Ship name contains invalid characters."
     return True, ""
 
 
-def safe_int_choice(raw: str, valid: Dict[int, str]) -> Optional[int]:
+def safe_int_choice(raw: str, valid: Container[int]) -> Optional[int]:
     """
     Reliability: prevents crashes from invalid numeric input.
     Returns an int if valid, else None.
@@ -190,102 +288,138 @@ QUALITY_ATTRIBUTES = [
     }
 ]
 
+# Display strings built once at import: the payloads above are immutable,
+# so each showing is a single write instead of per-item dict lookups and
+# f-string formatting.
+_USER_STORIES_RENDERED = "\n".join(
+    f"{i}) User Story:\n   {item['story']}\n\n"
+    f"   Acceptance Criterion (Given/When/Then):\n   {item['criteria']}\n"
+    for i, item in enumerate(USER_STORIES, start=1)
+)
+
+_QUALITY_ATTRIBUTES_RENDERED = "\n".join(
+    f"{i}) Quality Attribute: {qa['name']}\n"
+    f"   Non-functional acceptance criterion: {qa['nfr']}\n"
+    f"   Where/how it's satisfied: {qa['where']}\n"
+    for i, qa in enumerate(QUALITY_ATTRIBUTES, start=1)
+)
+
 
 # -----------------------------
 # Inclusivity Heuristics (1..8)
 # NOTE: Your course defines these; this implementation makes them demonstrable.
 # -----------------------------
 
+_INCLUSIVITY_BODY = (
+    "H1: Provide choice & control -> Settings menu (text size, contrast, reduced motion, confirmations)\n"
+    "H2: Support different abilities -> Large text + reduced motion + high contrast (not color-only)\n"
+    "H3: Clear, consistent language -> Simple words, consistent menus, no jargon required\n"
+    "H4: Prevent errors / easy recovery -> Validation + re-prompting + confirmations\n"
+    "H5: Respectful, neutral tone -> No identity assumptions; inclusive terms (player/callsign)\n"
+    "H6: Multiple ways to understand -> Optional hints/tooltips; short summaries of consequences\n"
+    "H7: Privacy & safety -> No accounts, no tracking, no external APIs, no personal data needed\n"
+    "H8: Transparent consequences -> Mission choices show what will change before you commit\n"
+)
+
+_INCLUSIVITY_HINT = ("In your video, open Settings and toggle options, "
+                     "then show a mission choice with a consequence preview.")
+
+
 def show_inclusivity_map(ui: UI) -> None:
     ui.header("Inclusivity Heuristics (Where to show in your video)")
-    ui.body(
-        "H1: Provide choice & control -> Settings menu (text size, contrast, reduced motion, confirmations)\n"
-        "H2: Support different abilities -> Large text + reduced motion + high contrast (not color-only)\n"
-        "H3: Clear, consistent language -> Simple words, consistent menus, no jargon required\n"
-        "H4: Prevent errors / easy recovery -> Validation + re-prompting + confirmations\n"
-        "H5: Respectful, neutral tone -> No identity assumptions; inclusive terms (player/callsign)\n"
-        "H6: Multiple ways to understand -> Optional hints/tooltips; short summaries of consequences\n"
-        "H7: Privacy & safety -> No accounts, no tracking, no external APIs, no personal data needed\n"
-        "H8: Transparent consequences -> Mission choices show what will change before you commit\n"
-    )
-    ui.hint("In your video, open Settings and toggle options, then show a mission choice with a consequence preview.")
+    ui.body(_INCLUSIVITY_BODY)
+    ui.hint(_INCLUSIVITY_HINT)
 
 
 # -----------------------------
 # Menus / Game Flow
 # -----------------------------
 
+# Valid option numbers per menu, built once so each prompt loop reuses the
+# same frozenset instead of allocating a fresh container.
+_MAIN_VALID = frozenset(range(1, 10))
+_SETTINGS_VALID = frozenset(range(1, 8))
+_PROFILE_VALID = frozenset(range(1, 4))
+_MISSION_VALID = frozenset(range(1, 4))
+
 def show_user_stories(ui: UI) -> None:
     ui.header("User Stories + Acceptance Criteria (Read in your video)")
-    for i, item in enumerate(USER_STORIES, start=1):
-        ui.body(f"{i}) User Story:\n   {item['story']}\n")
-        ui.body(f"   Acceptance Criterion (Given/When/Then):\n   {item['criteria']}\n")
+    ui.body(_USER_STORIES_RENDERED)
     ui.hint("In the video, demonstrate each acceptance criterion in the same order.")
 
 
 def show_quality_attributes(ui: UI) -> None:
     ui.header("Quality Attributes (Read + Show in your video)")
-    for i, qa in enumerate(QUALITY_ATTRIBUTES, start=1):
-        ui.body(f"{i}) Quality Attribute: {qa['name']}")
-        ui.body(f"   Non-functional acceptance criterion: {qa['nfr']}")
-        ui.body(f"   Where/how it's satisfied: {qa['where']}\n")
+    ui.body(_QUALITY_ATTRIBUTES_RENDERED)
+
+
+# Stable menu labels, interned so the menu lines and the toggle table
+# share one string object apiece instead of duplicate literals.
+_LABEL_TEXT_SIZE = sys.intern("Text size")
+_LABEL_HIGH_CONTRAST = sys.intern("High contrast")
+_LABEL_REDUCED_MOTION = sys.intern("Reduced motion")
+_LABEL_CONFIRM_ACTIONS = sys.intern("Confirm actions")
+_LABEL_SHOW_TOOLTIPS = sys.intern("Show tooltips")
+_LABEL_CINEMATIC_DELAYS = sys.intern("Cinematic delays")
+_LABEL_SHIP_NAME = sys.intern("Ship name")
+_LABEL_CALLSIGN = sys.intern("Callsign")
+
+# Settings toggles as data: option number -> (prefs attribute, toggle, label).
+# A dict lookup replaces the per-keystroke if/elif scan over every option.
+_SETTINGS_TOGGLES = {
+    1: ("text_size", lambda v: "large" if v == "normal" else "normal", _LABEL_TEXT_SIZE),
+    2: ("high_contrast", lambda v: not v, _LABEL_HIGH_CONTRAST),
+    3: ("reduced_motion", lambda v: not v, _LABEL_REDUCED_MOTION),
+    4: ("confirm_actions", lambda v: not v, _LABEL_CONFIRM_ACTIONS),
+    5: ("show_tooltips", lambda v: not v, _LABEL_SHOW_TOOLTIPS),
+    6: ("cinematic_delays", lambda v: not v, _LABEL_CINEMATIC_DELAYS),
+}
 
 
 def settings_menu(ui: UI, prefs: PlayerPrefs) -> None:
     while True:
-        ui.header("Settings")
-        ui.body(f"1) Text size: {prefs.text_size}")
-        ui.body(f"2) High contrast: {prefs.high_contrast}")
-        ui.body(f"3) Reduced motion: {prefs.reduced_motion}")
-        ui.body(f"4) Confirm actions: {prefs.confirm_actions}")
-        ui.body(f"5) Show tooltips: {prefs.show_tooltips}")
-        ui.body("6) Back")
-
-        valid = {
-            1: "text_size",
-            2: "high_contrast",
-            3: "reduced_motion",
-            4: "confirm_actions",
-            5: "show_tooltips",
-            6: "back",
-        }
-        choice = safe_int_choice(ui.ask("Choose an option (1-6):"), valid)
+        ui.begin_frame()
+        lines = (
+            f"1) {_LABEL_TEXT_SIZE}: {prefs.text_size}",
+            f"2) {_LABEL_HIGH_CONTRAST}: {prefs.high_contrast}",
+            f"3) {_LABEL_REDUCED_MOTION}: {prefs.reduced_motion}",
+            f"4) {_LABEL_CONFIRM_ACTIONS}: {prefs.confirm_actions}",
+            f"5) {_LABEL_SHOW_TOOLTIPS}: {prefs.show_tooltips}",
+            f"6) {_LABEL_CINEMATIC_DELAYS}: {prefs.cinematic_delays}",
+            "7) Back",
+        )
+        ui.menu("Settings", lines)
+        ui.end_frame()
+
+        choice = safe_int_choice(ui.ask("Choose an option (1-7):"), _SETTINGS_VALID)
         if choice is None:
-            ui.error("I couldn't read that as a valid option. Please enter a number from 1 to 6.")
+            ui.error("I couldn't read that as a valid option. Please enter a number from 1 to 7.")
             continue
 
-        if choice == 1:
-            prefs.text_size = "large" if prefs.text_size == "normal" else "normal"
-            ui.success(f"Text size set to: {prefs.text_size}")
-        elif choice == 2:
-            prefs.high_contrast = not prefs.high_contrast
-            ui.success(f"High contrast set to: {prefs.high_contrast}")
-        elif choice == 3:
-            prefs.reduced_motion = not prefs.reduced_motion
-            ui.success(f"Reduced motion set to: {prefs.reduced_motion}")
-        elif choice == 4:
-            prefs.confirm_actions = not prefs.confirm_actions
-            ui.success(f"Confirm actions set to: {prefs.confirm_actions}")
-        elif choice == 5:
-            prefs.show_tooltips = not prefs.show_tooltips
-            ui.success(f"Show tooltips set to: {prefs.show_tooltips}")
-        else:
+        if choice == 7:
             return
 
-        ui.wait(0.2)
+        attr, toggle, label = _SETTINGS_TOGGLES[choice]
+        new_val = toggle(getattr(prefs, attr))
+        setattr(prefs, attr, new_val)
+        ui.refresh_prefs()
+        ui.success(f"{label} set to: {new_val}")
 
 
 def profile_menu(ui: UI, state: GameState) -> None:
     while True:
-        ui.header("Profile")
-        ui.body(f"Ship name: {state.ship_name}")
-        ui.body(f"Callsign: {state.callsign}")
-        ui.body("1) Edit ship name")
-        ui.body("2) Edit callsign")
-        ui.body("3) Back")
-
-        valid = {1: "ship", 2: "callsign", 3: "back"}
-        choice = safe_int_choice(ui.ask("Choose an option (1-3):"), valid)
+        ui.begin_frame()
+        lines = (
+            f"{_LABEL_SHIP_NAME}: {state.ship_name}",
+            f"{_LABEL_CALLSIGN}: {state.callsign}",
+            "1) Edit ship name",
+            "2) Edit callsign",
+            "3) Back",
+        )
+        ui.menu("Profile", lines)
+        ui.end_frame()
+
+        choice = safe_int_choice(ui.ask("Choose an option (1-3):"), _PROFILE_VALID)
         if choice is None:
             ui.error("Please enter 1, 2, or 3.")
             continue
@@ -310,31 +444,49 @@ def profile_menu(ui: UI, state: GameState) -> None:
             return
 
 
+# Shared display templates: only substitution runs per call instead of
+# rebuilding the multi-line f-string each redraw.
+_MISSION_BRIEF_TMPL = (
+    "Ship: {ship}\n"
+    "Operator: {callsign}\n\n"
+    "A communications relay is failing inside the Vesper Nebula.\n"
+    "You can spend power to boost the relay, or conserve power and attempt a manual reroute.\n"
+)
+
+_STATUS_TMPL = (
+    "Ship: {ship}\n"
+    "Callsign: {callsign}\n"
+    "Chapter: {chapter}\n"
+    "Power cells: {power_cells}\n"
+    "Distress packets sent: {packets}\n"
+    "Last choice: {last_choice}\n"
+)
+
+
 def mission_brief(ui: UI, state: GameState) -> None:
     ui.header("Mission Brief: The Nebula Relay")
-    ui.body(
-        f"Ship: {state.ship_name}\n"
-        f"Operator: {state.callsign}\n\n"
-        "A communications relay is failing inside the Vesper Nebula.\n"
-        "You can spend power to boost the relay, or conserve power and attempt a manual reroute.\n"
-    )
+    ui.body(_MISSION_BRIEF_TMPL.format(ship=state.ship_name, callsign=state.callsign))
     ui.hint("Your choice will change your resources. This is intentional (meaningful decisions).")
     ui.wait(0.4)
 
 
 def mission_choice(ui: UI, state: GameState) -> None:
     while True:
-        ui.header("Decision Point")
-        ui.body(f"Power cells available: {state.power_cells}")
-        ui.body(f"Distress packets sent: {state.distress_packets_sent}\n")
-        ui.body("1) Boost the comms relay (Costs 1 power cell; sends 1 distress packet)")
-        ui.body("2) Manual reroute (No cost; lower success chance)")
-        ui.body("3) Back")
+        ui.begin_frame()
+        lines = (
+            f"Power cells available: {state.power_cells}",
+            f"Distress packets sent: {state.distress_packets_sent}",
+            "",
+            "1) Boost the comms relay (Costs 1 power cell; sends 1 distress packet)",
+            "2) Manual reroute (No cost; lower success chance)",
+            "3) Back",
+        )
+        ui.menu("Decision Point", lines)
 
         ui.hint("Transparent consequences: Option 1 costs power but increases communication reliability.")
+        ui.end_frame()
 
-        valid = {1: "boost", 2: "reroute", 3: "back"}
-        choice = safe_int_choice(ui.ask("Choose an option (1-3):"), valid)
+        choice = safe_int_choice(ui.ask("Choose an option (1-3):"), _MISSION_VALID)
         if choice is None:
             ui.error("That option isn't recognized. Enter 1, 2, or 3.")
             continue
@@ -370,14 +522,14 @@ def mission_choice(ui: UI, state: GameState) -> None:
 
 def status_screen(ui: UI, state: GameState) -> None:
     ui.header("Status")
-    ui.body(
-        f"Ship: {state.ship_name}\n"
-        f"Callsign: {state.callsign}\n"
-        f"Chapter: {state.chapter}\n"
-        f"Power cells: {state.power_cells}\n"
-        f"Distress packets sent: {state.distress_packets_sent}\n"
-        f"Last choice: {state.last_choice}\n"
-    )
+    ui.body(_STATUS_TMPL.format(
+        ship=state.ship_name,
+        callsign=state.callsign,
+        chapter=state.chapter,
+        power_cells=state.power_cells,
+        packets=state.distress_packets_sent,
+        last_choice=state.last_choice,
+    ))
     ui.hint("This screen makes game state visible and understandable (transparency).")
 
 
@@ -392,56 +544,68 @@ def help_menu(ui: UI) -> None:
     )
 
 
+def _start_mission(ui: UI, prefs: PlayerPrefs, state: GameState) -> None:
+    mission_brief(ui, state)
+    mission_choice(ui, state)
+
+
+# Main-menu dispatch table: option number -> handler. Handlers share one
+# signature so the menu loop is a single dict lookup plus a call.
+_MAIN_DISPATCH = {
+    1: lambda ui, prefs, state: show_user_stories(ui),
+    2: lambda ui, prefs, state: show_inclusivity_map(ui),
+    3: lambda ui, prefs, state: show_quality_attributes(ui),
+    4: _start_mission,
+    5: lambda ui, prefs, state: status_screen(ui, state),
+    6: lambda ui, prefs, state: profile_menu(ui, state),
+    7: lambda ui, prefs, state: settings_menu(ui, prefs),
+    8: lambda ui, prefs, state: help_menu(ui),
+}
+
+_MAIN_MENU_LINES = (
+    "1) Show User Stories + Acceptance Criteria",
+    "2) Show Inclusivity Heuristics Map",
+    "3) Show Quality Attributes",
+    "4) Start Mission (interactive)",
+    "5) Status",
+    "6) Profile",
+    "7) Settings",
+    "8) Help",
+    "9) Exit",
+)
+
+
 def main_menu(ui: UI, prefs: PlayerPrefs, state: GameState) -> None:
     while True:
-        ui.header("Nebula Relay — Milestone #1")
-        ui.body("1) Show User Stories + Acceptance Criteria")
-        ui.body("2) Show Inclusivity Heuristics Map")
-        ui.body("3) Show Quality Attributes")
-        ui.body("4) Start Mission (interactive)")
-        ui.body("5) Status")
-        ui.body("6) Profile")
-        ui.body("7) Settings")
-        ui.body("8) Help")
-        ui.body("9) Exit")
-
-        valid = {1: "stories", 2: "heuristics", 3: "qa", 4: "mission", 5: "status",
-                 6: "profile", 7: "settings", 8: "help", 9: "exit"}
+        ui.begin_frame()
+        ui.menu("Nebula Relay — Milestone #1", _MAIN_MENU_LINES)
+        ui.end_frame()
 
         raw = ui.ask("Choose an option (1-9):")
-        choice = safe_int_choice(raw, valid)
+        choice = safe_int_choice(raw, _MAIN_VALID)
 
         if choice is None:
             # User story #3 acceptance criterion + reliability QA
             ui.error("Invalid input. Please type a number from 1 to 9. (No worries — try again.)")
             continue
 
-        if choice == 1:
-            show_user_stories(ui)
-        elif choice == 2:
-            show_inclusivity_map(ui)
-        elif choice == 3:
-            show_quality_attributes(ui)
-        elif choice == 4:
-            mission_brief(ui, state)
-            mission_choice(ui, state)
-        elif choice == 5:
-            status_screen(ui, state)
-        elif choice == 6:
-            profile_menu(ui, state)
-        elif choice == 7:
-            settings_menu(ui, prefs)
-        elif choice == 8:
-            help_menu(ui)
-        else:
+        if choice == 9:
             ui.header("Exit")
             ui.body("Thanks for playing Nebula Relay. Good luck with your Milestone #1 video!")
             return
 
-        ui.wait(0.2)
+        _MAIN_DISPATCH[choice](ui, prefs, state)
 
 
 def main() -> None:
+    # Block-buffer stdout for the whole session (a TTY defaults to a
+    # flush per newline). UI.ask() flushes before blocking on input, so
+    # prompts still appear before the game waits.
+    try:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError):
+        pass  # non-reconfigurable stream (e.g. replaced stdout); fine as-is
+
     prefs = PlayerPrefs()
     ui = UI(prefs)
     state = GameState()
@@ -452,9 +616,14 @@ def main() -> None:
         "This is a small sci-fi interactive program built to demonstrate Milestone #1.\n"
         "Tip: Open Settings if you want large text, high contrast, or reduced motion.\n"
     )
-    ui.wait(0.4)
 
-    main_menu(ui, prefs, state)
+    try:
+        main_menu(ui, prefs, state)
+    except EOFError:
+        # Input stream ended (Ctrl-D or exhausted pipe): exit gracefully
+        # instead of re-prompting forever.
+        ui.header("Exit")
+        ui.body("Input ended. Thanks for playing Nebula Relay!")
 
 
 if __name__ == "__main__":